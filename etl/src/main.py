@@ -5,10 +5,11 @@ from typing import AsyncGenerator
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from prometheus_fastapi_instrumentator import Instrumentator
 
 from src.config import settings
 from src.routes import health, documents
-from src.services import qdrant_client, minio_client
+from src.services import qdrant_client, minio_client, embedding, embedding_cache, parser
 
 logging.basicConfig(level=logging.INFO)
 logger = structlog.get_logger()
@@ -18,11 +19,16 @@ logger = structlog.get_logger()
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     logger.info("ETL Service starting", version="0.1.0")
     # Initialize services
-    minio_client.ensure_bucket()
+    await minio_client.ensure_bucket()
     await qdrant_client.ensure_collection()
     logger.info("Services initialized")
     yield
     logger.info("ETL Service shutting down")
+    await embedding.close_client()
+    await minio_client.close_client()
+    await qdrant_client.close_client()
+    await embedding_cache.close_cache()
+    parser.shutdown_pool()
 
 
 app = FastAPI(
@@ -41,6 +47,9 @@ app.add_middleware(
 app.include_router(health.router, tags=["health"])
 app.include_router(documents.router, prefix="/api/v1", tags=["documents"])
 
+# Request metrics plus the pipeline stage histograms, scraped from /metrics
+Instrumentator().instrument(app).expose(app, include_in_schema=False)
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run("src.main:app", host="0.0.0.0", port=8001, reload=True)
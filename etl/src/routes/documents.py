@@ -1,9 +1,9 @@
 """Document management routes."""
 import logging
+from typing import Any
 from uuid import UUID
 
 from fastapi import APIRouter, UploadFile, File, Form, HTTPException
-from fastapi.responses import JSONResponse
 
 from src.services import pipeline, qdrant_client, minio_client
 
@@ -12,15 +12,19 @@ router = APIRouter()
 
 ALLOWED_EXTENSIONS = {".pdf", ".docx"}
 MAX_FILE_SIZE = 100 * 1024 * 1024  # 100MB
+SIZE_CHECK_CHUNK = 1024 * 1024  # 1MB
 
 
-@router.post("/documents/upload")
+@router.post("/documents/upload", status_code=202)
 async def upload_document(
     file: UploadFile = File(...),
     document_type: str = Form(""),
     department: str = Form(""),
-) -> JSONResponse:
+) -> dict[str, Any]:
     """Upload and process a document."""
+    if await _exceeds_max_size(file):
+        raise HTTPException(status_code=413, detail="File too large. Max 100MB.")
+
     file_name = file.filename or "unknown"
     file_ext = "." + file_name.rsplit(".", 1)[-1].lower()
 
@@ -30,47 +34,55 @@ async def upload_document(
             detail=f"Unsupported file type: {file_ext}. Allowed: {ALLOWED_EXTENSIONS}",
         )
 
-    file_bytes = await file.read()
-
-    if len(file_bytes) > MAX_FILE_SIZE:
-        raise HTTPException(status_code=413, detail="File too large. Max 100MB.")
-
     try:
         result = await pipeline.process_document(
-            file_bytes, file_name, document_type, department
+            file.file, file_name, document_type, department
         )
     except Exception as e:
         logger.exception("ETL pipeline failed for %s", file_name)
         raise HTTPException(status_code=500, detail=f"Processing failed: {e}")
 
-    return JSONResponse(
-        status_code=202,
-        content={
-            "success": True,
-            "data": {
-                "document_id": result["document_id"],
-                "status": result["status"],
-                "chunk_count": result["chunk_count"],
-                "message": f"Document '{file_name}' processed successfully",
-            },
+    return {
+        "success": True,
+        "data": {
+            "document_id": result["document_id"],
+            "status": result["status"],
+            "chunk_count": result["chunk_count"],
+            "message": f"Document '{file_name}' processed successfully",
         },
-    )
+    }
+
+
+async def _exceeds_max_size(file: UploadFile) -> bool:
+    """Check the upload against MAX_FILE_SIZE without reading it into memory.
+
+    Uses the size Starlette recorded while spooling the upload. If that is
+    unknown, counts bytes in chunks and stops as soon as the limit is passed.
+    """
+    if file.size is not None:
+        return file.size > MAX_FILE_SIZE
+
+    total = 0
+    while chunk := await file.read(SIZE_CHECK_CHUNK):
+        total += len(chunk)
+        if total > MAX_FILE_SIZE:
+            return True
+    await file.seek(0)
+    return False
 
 
 @router.get("/documents")
-async def list_documents() -> JSONResponse:
+async def list_documents() -> dict[str, Any]:
     """List all documents (placeholder)."""
-    return JSONResponse(
-        content={
-            "success": True,
-            "data": [],
-            "meta": {"total": 0, "page": 1, "limit": 20},
-        }
-    )
+    return {
+        "success": True,
+        "data": [],
+        "meta": {"total": 0, "page": 1, "limit": 20},
+    }
 
 
 @router.post("/search")
-async def search_documents(request: dict) -> JSONResponse:  # type: ignore[type-arg]
+async def search_documents(request: dict) -> dict[str, Any]:  # type: ignore[type-arg]
     """Search documents using vector similarity."""
     from src.services import embedding as emb_service
 
@@ -99,9 +111,7 @@ async def search_documents(request: dict) -> JSONResponse:  # type: ignore[type-
         query_vector=query_vector, limit=limit, filters=search_filters
     )
 
-    return JSONResponse(
-        content={
-            "success": True,
-            "data": {"results": results, "total": len(results)},
-        }
-    )
+    return {
+        "success": True,
+        "data": {"results": results, "total": len(results)},
+    }
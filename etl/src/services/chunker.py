@@ -1,12 +1,18 @@
 """Semantic text chunker for Japanese documents."""
 import re
 import logging
+from collections.abc import Iterable, Iterator
 
 logger = logging.getLogger(__name__)
 
 DEFAULT_CHUNK_SIZE = 512
 DEFAULT_CHUNK_OVERLAP = 64
 
+MAX_HEADING_LEVEL = 4
+_PARA_RE = re.compile(r"\n\s*\n")
+# A sentence runs up to and including a Japanese sentence ending (。！？) or newline
+_SENT_RE = re.compile(r"[^。！？\n]*(?:[。！？\n]|\Z)")
+
 
 def chunk_text(
     text: str,
@@ -14,97 +20,171 @@ def chunk_text(
     chunk_overlap: int = DEFAULT_CHUNK_OVERLAP,
 ) -> list[dict[str, str | int]]:
     """Split text into semantic chunks.
-    
+
     Priority: heading boundaries > paragraph boundaries > sentence boundaries
     """
-    if not text.strip():
+    stripped = text.strip()
+    if not stripped:
         return []
 
-    # Split by headings first
-    sections = _split_by_headings(text)
+    # Short text with no headings or paragraph breaks is a single chunk as-is
+    if (
+        len(stripped) <= min(chunk_size, DEFAULT_CHUNK_SIZE)
+        and "#" not in stripped
+        and not _PARA_RE.search(stripped)
+    ):
+        return [_make_chunk(stripped, 0, "")]
+
+    return list(chunk_text_stream([text], chunk_size, chunk_overlap))
 
-    chunks: list[dict[str, str | int]] = []
-    chunk_index = 0
 
-    for section in sections:
-        heading = section.get("heading", "")
-        body = section.get("body", "")
-
-        # Split section body into paragraphs
-        paragraphs = _split_by_paragraphs(body)
-
-        current_chunk: list[str] = []
-        current_length = 0
-
-        if heading:
-            current_chunk.append(heading)
-            current_length += len(heading)
-
-        for para in paragraphs:
-            para_len = len(para)
-
-            if current_length + para_len > chunk_size and current_chunk:
-                chunk_text_joined = "\n".join(current_chunk)
-                chunks.append({
-                    "text": chunk_text_joined,
-                    "chunk_index": chunk_index,
-                    "heading": heading,
-                    "char_count": len(chunk_text_joined),
-                })
-                chunk_index += 1
-
-                # Overlap: keep last portion
-                overlap_text = chunk_text_joined[-chunk_overlap:] if chunk_overlap > 0 else ""
-                current_chunk = [overlap_text] if overlap_text else []
-                current_length = len(overlap_text)
-
-            current_chunk.append(para)
-            current_length += para_len
-
-        if current_chunk:
-            chunk_text_joined = "\n".join(current_chunk)
-            if chunk_text_joined.strip():
-                chunks.append({
-                    "text": chunk_text_joined,
-                    "chunk_index": chunk_index,
-                    "heading": heading,
-                    "char_count": len(chunk_text_joined),
-                })
-                chunk_index += 1
-
-    return chunks
-
-
-def _split_by_headings(text: str) -> list[dict[str, str]]:
-    """Split text by markdown headings."""
-    heading_pattern = re.compile(r"^(#{1,4})\s+(.+)$", re.MULTILINE)
-    sections: list[dict[str, str]] = []
+def chunk_text_stream(
+    pages: Iterable[str],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    chunk_overlap: int = DEFAULT_CHUNK_OVERLAP,
+) -> Iterator[dict[str, str | int]]:
+    """Split a document into semantic chunks one page at a time.
+
+    Sections continue across page boundaries, so the chunks match those of
+    chunk_text("\n\n".join(pages)) without building the joined text. Headings
+    are matched per page and never take their title from the next page.
+    """
+    chunk_index = 0
+    heading = ""
+    current_chunk: list[str] = []
+    current_length = 0
+
+    for page in pages:
+        for section in _split_by_headings(page):
+            if section["heading"] is not None:
+                # A new heading closes the previous section
+                if current_chunk:
+                    chunk_text_joined = "\n".join(current_chunk)
+                    if chunk_text_joined.strip():
+                        yield _make_chunk(chunk_text_joined, chunk_index, heading)
+                        chunk_index += 1
+
+                heading = section["heading"]
+                current_chunk = [heading] if heading else []
+                current_length = len(heading)
+
+            for para in _split_by_paragraphs(section["body"] or ""):
+                para_len = len(para)
+
+                if current_length + para_len > chunk_size and current_chunk:
+                    # Joined once per flush; the overlap is sliced from the same string
+                    chunk_text_joined = "\n".join(current_chunk)
+                    yield _make_chunk(chunk_text_joined, chunk_index, heading)
+                    chunk_index += 1
+
+                    # Overlap: keep last portion
+                    overlap_text = chunk_text_joined[-chunk_overlap:] if chunk_overlap > 0 else ""
+                    current_chunk = [overlap_text] if overlap_text else []
+                    current_length = len(overlap_text)
+
+                current_chunk.append(para)
+                current_length += para_len
+
+    if current_chunk:
+        chunk_text_joined = "\n".join(current_chunk)
+        if chunk_text_joined.strip():
+            yield _make_chunk(chunk_text_joined, chunk_index, heading)
+
+
+def _make_chunk(text: str, chunk_index: int, heading: str) -> dict[str, str | int]:
+    return {
+        "text": text,
+        "chunk_index": chunk_index,
+        "heading": heading,
+        "char_count": len(text),
+    }
+
+
+def _split_by_headings(text: str) -> list[dict[str, str | None]]:
+    """Split text by markdown headings.
+
+    Text before the first heading is returned with heading None, since it
+    continues whatever section was open (e.g. from the previous page).
+    """
+    sections: list[dict[str, str | None]] = []
     last_end = 0
-    last_heading = ""
+    last_heading: str | None = None
 
-    for match in heading_pattern.finditer(text):
-        if match.start() > last_end:
-            body = text[last_end:match.start()].strip()
-            if body or last_heading:
+    for start, end, title in _iter_headings(text):
+        if start > last_end:
+            body = text[last_end:start].strip()
+            if body or last_heading is not None:
                 sections.append({"heading": last_heading, "body": body})
 
-        last_heading = match.group(2).strip()
-        last_end = match.end()
+        last_heading = title.strip()
+        last_end = end
 
     # Remaining text
     remaining = text[last_end:].strip()
-    if remaining or last_heading:
+    if remaining or last_heading is not None:
         sections.append({"heading": last_heading, "body": remaining})
 
-    if not sections:
-        sections.append({"heading": "", "body": text})
-
     return sections
 
 
+def _iter_headings(text: str) -> Iterator[tuple[int, int, str]]:
+    r"""Yield (start, end, title) for each markdown heading line.
+
+    Equivalent to finditer over r"^(#{1,4})\s+(.+)$" in MULTILINE mode, but
+    jumps between candidate lines with str.find instead of running a regex
+    over every line.
+    """
+    search_from = 0
+    start = 0 if text.startswith("#") else -1
+
+    while True:
+        if start < 0:
+            newline = text.find("\n#", search_from)
+            if newline < 0:
+                return
+            start = newline + 1
+
+        heading = _match_heading(text, start)
+        if heading is not None:
+            yield heading
+            search_from = heading[1]
+        else:
+            search_from = start
+        start = -1
+
+
+def _match_heading(text: str, start: int) -> tuple[int, int, str] | None:
+    """Match a heading at a line start, mirroring the regex backtracking."""
+    length = len(text)
+    pos = start
+    while pos < length and text[pos] == "#":
+        pos += 1
+    if pos - start > MAX_HEADING_LEVEL or pos >= length or not text[pos].isspace():
+        return None
+
+    # Skip the whitespace after the hashes; it may span blank lines
+    title_start = pos + 1
+    while title_start < length and text[title_start].isspace():
+        title_start += 1
+
+    if title_start == length:
+        # Only whitespace remains: the title is the last non-newline character
+        title_start = length - 1
+        while title_start > pos and text[title_start] == "\n":
+            title_start -= 1
+        if title_start == pos:
+            return None
+        return start, title_start + 1, text[title_start]
+
+    end = text.find("\n", title_start)
+    if end < 0:
+        end = length
+    return start, end, text[title_start:end]
+
+
 def _split_by_paragraphs(text: str) -> list[str]:
     """Split text by paragraph boundaries."""
-    paragraphs = re.split(r"\n\s*\n", text)
+    paragraphs = _PARA_RE.split(text)
     result: list[str] = []
 
     for para in paragraphs:
@@ -124,6 +204,5 @@ def _split_by_paragraphs(text: str) -> list[str]:
 
 def _split_by_sentences(text: str) -> list[str]:
     """Split text by Japanese sentence boundaries."""
-    # Japanese sentence endings: 。！？ and newlines
-    sentences = re.split(r"(?<=[。！？\n])\s*", text)
+    sentences = _SENT_RE.findall(text)
     return [s.strip() for s in sentences if s.strip()]
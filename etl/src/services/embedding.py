@@ -1,24 +1,78 @@
 """Client for LLM Service embedding API."""
+import base64
 import logging
+import struct
 from typing import Any
 
 import httpx
 
 from src.config import settings
+from src.services.embedding_cache import get_cache
 
 logger = logging.getLogger(__name__)
 
+_client: httpx.AsyncClient | None = None
+
+
+def get_client() -> httpx.AsyncClient:
+    """Return the shared LLM Service HTTP client, creating it on first use."""
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(
+            timeout=120.0,
+            limits=httpx.Limits(max_keepalive_connections=16, max_connections=32),
+        )
+    return _client
+
+
+async def close_client() -> None:
+    """Close the shared HTTP client and its connection pool."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
 
 async def generate_embeddings(texts: list[str]) -> list[dict[str, Any]]:
-    """Generate embeddings via LLM Service."""
+    """Generate embeddings via LLM Service.
+
+    Cached vectors are served from Redis; only cache misses are sent to the
+    LLM Service. Results are returned in the order of ``texts``.
+    """
     if not texts:
         return []
 
-    async with httpx.AsyncClient(timeout=120.0) as client:
-        resp = await client.post(
-            f"{settings.llm_service_url}/internal/embeddings",
-            json={"texts": texts, "return_sparse": True},
+    cache = get_cache()
+    cached = await cache.mget(texts)
+    miss_texts = [t for t, emb in zip(texts, cached) if emb is None]
+    if not miss_texts:
+        return [emb for emb in cached if emb is not None]
+
+    fresh = await _request_embeddings(miss_texts)
+    if len(fresh) != len(miss_texts):
+        raise ValueError(
+            f"LLM Service returned {len(fresh)} embeddings for {len(miss_texts)} texts"
         )
-        resp.raise_for_status()
-        data = resp.json()
-        return data.get("embeddings", [])
+    await cache.mset(miss_texts, fresh)
+
+    fresh_iter = iter(fresh)
+    return [emb if emb is not None else next(fresh_iter) for emb in cached]
+
+
+async def _request_embeddings(texts: list[str]) -> list[dict[str, Any]]:
+    # Vectors come back as base64 float16, several times smaller than JSON floats
+    resp = await get_client().post(
+        f"{settings.llm_service_url}/internal/embeddings",
+        json={"texts": texts, "return_sparse": True, "binary": True},
+    )
+    resp.raise_for_status()
+    data = resp.json()
+    return [
+        {"dense": _decode_fp16(emb["dense_fp16_b64"])} if "dense_fp16_b64" in emb else emb
+        for emb in data.get("embeddings", [])
+    ]
+
+
+def _decode_fp16(encoded: str) -> list[float]:
+    raw = base64.b64decode(encoded)
+    return list(struct.unpack(f"<{len(raw) // 2}e", raw))
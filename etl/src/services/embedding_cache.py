@@ -0,0 +1,94 @@
+"""Redis-backed cache for dense embeddings."""
+import logging
+from array import array
+from hashlib import blake2b
+from typing import Any
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from src.config import settings
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "emb"
+# Keep Redis stalls short: a lookup that times out is just a cache miss
+REDIS_TIMEOUT = 0.2  # seconds
+
+
+class EmbeddingsCache:
+    """Cache dense vectors keyed by embedding model and text hash.
+
+    Vectors are stored as packed float32 bytes. Redis errors are logged and
+    treated as cache misses so embedding generation never depends on Redis.
+    """
+
+    def __init__(self, redis: Redis, model_name: str, ttl: int) -> None:
+        self._redis = redis
+        self._model_name = model_name
+        self._ttl = ttl
+
+    def key(self, text: str) -> str:
+        digest = blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+        return f"{KEY_PREFIX}:{self._model_name}:{digest}"
+
+    async def mget(self, texts: list[str]) -> list[dict[str, Any] | None]:
+        """Look up all texts in one round-trip. Misses are returned as None."""
+        if not texts:
+            return []
+        try:
+            values = await self._redis.mget([self.key(t) for t in texts])
+        except RedisError:
+            logger.warning("Embedding cache lookup failed", exc_info=True)
+            return [None] * len(texts)
+        return [{"dense": _decode(v)} if isinstance(v, bytes) else None for v in values]
+
+    async def mset(self, texts: list[str], embeddings: list[dict[str, Any]]) -> None:
+        """Store embeddings for texts in a single pipelined round-trip."""
+        if not texts:
+            return
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                for text, emb in zip(texts, embeddings):
+                    pipe.set(self.key(text), _encode(emb.get("dense", [])), ex=self._ttl)
+                await pipe.execute()
+        except RedisError:
+            logger.warning("Embedding cache store failed", exc_info=True)
+
+    async def close(self) -> None:
+        await self._redis.aclose()
+
+
+def _encode(vector: list[float]) -> bytes:
+    return array("f", vector).tobytes()
+
+
+def _decode(raw: bytes) -> list[float]:
+    return array("f", raw).tolist()
+
+
+_cache: EmbeddingsCache | None = None
+
+
+def get_cache() -> EmbeddingsCache:
+    """Return the shared embeddings cache, creating it on first use."""
+    global _cache
+    if _cache is None:
+        _cache = EmbeddingsCache(
+            Redis.from_url(
+                settings.redis_url,
+                socket_connect_timeout=REDIS_TIMEOUT,
+                socket_timeout=REDIS_TIMEOUT,
+            ),
+            settings.embedding_model,
+            settings.embedding_cache_ttl,
+        )
+    return _cache
+
+
+async def close_cache() -> None:
+    """Close the shared Redis connection pool."""
+    global _cache
+    if _cache is not None:
+        await _cache.close()
+        _cache = None
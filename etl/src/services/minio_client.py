@@ -1,51 +1,88 @@
-"""MinIO object storage client."""
-import io
+"""MinIO object storage client (S3-compatible API via aioboto3)."""
 import logging
+from contextlib import AsyncExitStack
+from typing import TYPE_CHECKING, BinaryIO
 
-from minio import Minio
+import aioboto3
+from aiobotocore.config import AioConfig
+from boto3.s3.transfer import TransferConfig
+from botocore.exceptions import ClientError
 
 from src.config import settings
 
+if TYPE_CHECKING:
+    from types_aiobotocore_s3 import S3Client
+
 logger = logging.getLogger(__name__)
 
+UPLOAD_PART_SIZE = 5 * 1024 * 1024  # 5MB, the S3 minimum multipart size
 
-def get_minio_client() -> Minio:
-    """Create MinIO client."""
-    return Minio(
-        settings.minio_endpoint,
-        access_key=settings.minio_access_key,
-        secret_key=settings.minio_secret_key,
-        secure=False,
-    )
+_transfer_config = TransferConfig(
+    multipart_threshold=UPLOAD_PART_SIZE,
+    multipart_chunksize=UPLOAD_PART_SIZE,
+)
+
+_exit_stack: AsyncExitStack | None = None
+_client: "S3Client | None" = None
+
+
+async def get_minio_client() -> "S3Client":
+    """Return the shared S3 client for MinIO, creating it on first use."""
+    global _exit_stack, _client
+    if _client is None:
+        exit_stack = AsyncExitStack()
+        _client = await exit_stack.enter_async_context(
+            aioboto3.Session().client(
+                "s3",
+                endpoint_url=f"http://{settings.minio_endpoint}",
+                aws_access_key_id=settings.minio_access_key,
+                aws_secret_access_key=settings.minio_secret_key,
+                region_name="us-east-1",
+                # MinIO buckets are addressed by path, not by subdomain
+                config=AioConfig(s3={"addressing_style": "path"}),
+            )
+        )
+        _exit_stack = exit_stack
+    return _client
+
+
+async def close_client() -> None:
+    """Close the shared S3 client and its connection pool."""
+    global _exit_stack, _client
+    if _exit_stack is not None:
+        await _exit_stack.aclose()
+        _exit_stack = None
+        _client = None
 
 
-def ensure_bucket() -> None:
+async def ensure_bucket() -> None:
     """Create the documents bucket if it doesn't exist."""
-    client = get_minio_client()
-    if not client.bucket_exists(settings.minio_bucket):
-        client.make_bucket(settings.minio_bucket)
+    client = await get_minio_client()
+    try:
+        await client.head_bucket(Bucket=settings.minio_bucket)
+    except ClientError:
+        await client.create_bucket(Bucket=settings.minio_bucket)
         logger.info("Created bucket: %s", settings.minio_bucket)
 
 
-def upload_file(object_key: str, file_bytes: bytes, content_type: str) -> str:
-    """Upload a file to MinIO."""
-    client = get_minio_client()
-    client.put_object(
+async def upload_file(object_key: str, file_obj: BinaryIO, content_type: str) -> str:
+    """Upload a file to MinIO, streaming it in multipart chunks."""
+    client = await get_minio_client()
+    await client.upload_fileobj(
+        file_obj,
         settings.minio_bucket,
         object_key,
-        io.BytesIO(file_bytes),
-        length=len(file_bytes),
-        content_type=content_type,
+        ExtraArgs={"ContentType": content_type},
+        Config=_transfer_config,
     )
     logger.info("Uploaded %s to MinIO", object_key)
     return object_key
 
 
-def download_file(object_key: str) -> bytes:
+async def download_file(object_key: str) -> bytes:
     """Download a file from MinIO."""
-    client = get_minio_client()
-    response = client.get_object(settings.minio_bucket, object_key)
-    data = response.read()
-    response.close()
-    response.release_conn()
+    client = await get_minio_client()
+    response = await client.get_object(Bucket=settings.minio_bucket, Key=object_key)
+    async with response["Body"] as stream:
+        data: bytes = await stream.read()
     return data
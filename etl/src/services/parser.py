@@ -1,6 +1,9 @@
 """Document parser supporting PDF and Word formats."""
+import asyncio
 import io
 import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 
 import fitz  # PyMuPDF
@@ -8,31 +11,34 @@ from docx import Document as DocxDocument
 
 logger = logging.getLogger(__name__)
 
+_pool: ProcessPoolExecutor | None = None
+
 
 @dataclass
 class ParsedDocument:
-    text: str
     metadata: dict[str, str | int | None]
     pages: list[str]
 
+    @property
+    def text(self) -> str:
+        """Full document text. Built on each access; prefer iterating pages."""
+        return "\n\n".join(self.pages)
+
 
 def parse_pdf(file_bytes: bytes, file_name: str) -> ParsedDocument:
     """Extract text from PDF using PyMuPDF."""
     doc = fitz.open(stream=file_bytes, filetype="pdf")
     pages: list[str] = []
-    full_text_parts: list[str] = []
 
     for page_num in range(len(doc)):
         page = doc[page_num]
         text = page.get_text("text")
         if text.strip():
             pages.append(text)
-            full_text_parts.append(text)
 
     doc.close()
 
     return ParsedDocument(
-        text="\n\n".join(full_text_parts),
         metadata={
             "file_name": file_name,
             "file_type": "pdf",
@@ -46,7 +52,6 @@ def parse_pdf(file_bytes: bytes, file_name: str) -> ParsedDocument:
 def parse_docx(file_bytes: bytes, file_name: str) -> ParsedDocument:
     """Extract text from Word document."""
     doc = DocxDocument(io.BytesIO(file_bytes))
-    paragraphs: list[str] = []
     current_section: list[str] = []
     pages: list[str] = []
 
@@ -66,7 +71,6 @@ def parse_docx(file_bytes: bytes, file_name: str) -> ParsedDocument:
             current_section.append(f"## {text}")
         else:
             current_section.append(text)
-        paragraphs.append(text)
 
     if current_section:
         pages.append("\n".join(current_section))
@@ -75,11 +79,9 @@ def parse_docx(file_bytes: bytes, file_name: str) -> ParsedDocument:
     for table in doc.tables:
         table_md = _table_to_markdown(table)
         if table_md:
-            paragraphs.append(table_md)
             pages.append(table_md)
 
     return ParsedDocument(
-        text="\n\n".join(paragraphs),
         metadata={
             "file_name": file_name,
             "file_type": "docx",
@@ -110,3 +112,25 @@ def parse_document(file_bytes: bytes, file_name: str) -> ParsedDocument:
         return parse_docx(file_bytes, file_name)
     else:
         raise ValueError(f"Unsupported file type: {ext}")
+
+
+def get_pool() -> ProcessPoolExecutor:
+    """Return the shared parser process pool (one worker per CPU)."""
+    global _pool
+    if _pool is None:
+        _pool = ProcessPoolExecutor(mp_context=multiprocessing.get_context("spawn"))
+    return _pool
+
+
+def shutdown_pool() -> None:
+    """Shut down the shared parser process pool."""
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(cancel_futures=True)
+        _pool = None
+
+
+async def parse_document_async(file_bytes: bytes, file_name: str) -> ParsedDocument:
+    """Parse a document in the process pool so the event loop stays responsive."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_pool(), parse_document, file_bytes, file_name)
@@ -1,24 +1,38 @@
 """Main ETL processing pipeline."""
+import asyncio
 import logging
+from typing import Any, BinaryIO
 from uuid import uuid4
 
-from src.services.parser import parse_document
-from src.services.chunker import chunk_text
+from prometheus_client import Histogram
+
+from src.services.parser import parse_document_async
+from src.services.chunker import chunk_text_stream
 from src.services import embedding, qdrant_client, minio_client
 
 logger = logging.getLogger(__name__)
 
+EMBEDDING_BATCH_SIZE = 8
+EMBEDDING_CONCURRENCY = 4
+
+STAGE_DURATION = Histogram(
+    "etl_processing_duration_seconds",
+    "Time spent in each ETL pipeline stage",
+    ["stage"],
+    buckets=[0.01, 0.05, 0.1, 0.5, 1, 5, 30],
+)
+
 
 async def process_document(
-    file_bytes: bytes,
+    file: BinaryIO,
     file_name: str,
     document_type: str = "",
     department: str = "",
 ) -> dict[str, str | int]:
     """Full ETL pipeline for a document.
-    
+
     Steps:
-    1. Upload to MinIO
+    1. Upload to MinIO (in the background, overlapping steps 2-4)
     2. Parse document
     3. Chunk text
     4. Generate embeddings
@@ -32,59 +46,102 @@ async def process_document(
         "docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
     }
 
+    # The parsers need the whole file in memory; the upload streams from the file
+    file.seek(0)
+    file_bytes = await asyncio.to_thread(file.read)
+    file.seek(0)
+
     # Step 1: Upload to MinIO
     object_key = f"{document_id}/{file_name}"
-    minio_client.upload_file(
-        object_key, file_bytes, content_types.get(ext, "application/octet-stream")
-    )
+    upload_task = asyncio.create_task(_upload(
+        object_key, file, content_types.get(ext, "application/octet-stream"),
+    ))
+
+    metadata = {
+        "file_name": file_name,
+        "file_type": ext,
+        "document_type": document_type,
+        "department": department,
+    }
+    try:
+        chunks, embeddings = await _prepare_chunks(document_id, file_bytes, metadata)
+    except BaseException:
+        # The upload still reads from `file`; let it finish first
+        await asyncio.gather(upload_task, return_exceptions=True)
+        raise
+
+    # Index only once the original is stored, so no search hit points at a
+    # missing object
+    await upload_task
     logger.info("[%s] Uploaded to MinIO: %s", document_id, object_key)
 
+    # Step 5: Store in Qdrant
+    count = 0
+    if chunks:
+        with STAGE_DURATION.labels("upsert").time():
+            count = await qdrant_client.upsert_chunks(
+                document_id, chunks, embeddings, metadata
+            )
+        logger.info("[%s] Stored %d chunks in Qdrant", document_id, count)
+
+    return {
+        "document_id": document_id,
+        "status": "completed",
+        "chunk_count": count,
+        "minio_object_key": object_key,
+    }
+
+
+async def _prepare_chunks(
+    document_id: str, file_bytes: bytes, metadata: dict[str, str]
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """Parse, chunk and embed a document. Returns the chunks and their embeddings."""
     # Step 2: Parse document
-    parsed = parse_document(file_bytes, file_name)
+    with STAGE_DURATION.labels("parse").time():
+        parsed = await parse_document_async(file_bytes, metadata["file_name"])
     logger.info(
         "[%s] Parsed: %d pages, %d chars",
-        document_id, len(parsed.pages), len(parsed.text),
+        document_id, len(parsed.pages), sum(len(p) for p in parsed.pages),
     )
 
-    # Step 3: Chunk text
-    chunks = chunk_text(parsed.text)
+    # Step 3: Chunk text page by page, without joining the full document
+    with STAGE_DURATION.labels("chunk").time():
+        chunks = list(chunk_text_stream(parsed.pages))
     logger.info("[%s] Chunked into %d chunks", document_id, len(chunks))
 
     if not chunks:
-        return {
-            "document_id": document_id,
-            "status": "completed",
-            "chunk_count": 0,
-            "minio_object_key": object_key,
-        }
+        return [], []
 
     # Step 4: Generate embeddings
     texts = [c["text"] for c in chunks]
-    # Process in batches of 8
-    all_embeddings: list[dict] = []
-    batch_size = 8
-    for i in range(0, len(texts), batch_size):
-        batch = texts[i : i + batch_size]
-        batch_embeddings = await embedding.generate_embeddings(batch)
-        all_embeddings.extend(batch_embeddings)
+    with STAGE_DURATION.labels("embed").time():
+        # Embed each distinct text once, then map results back to every chunk
+        unique_texts = list(dict.fromkeys(texts))
+        unique_embeddings = await _embed_in_batches(unique_texts)
+
+        embedding_by_text = dict(zip(unique_texts, unique_embeddings))
+        all_embeddings = [embedding_by_text[t] for t in texts]
 
     logger.info("[%s] Generated %d embeddings", document_id, len(all_embeddings))
+    return chunks, all_embeddings
 
-    # Step 5: Store in Qdrant
-    metadata = {
-        "file_name": file_name,
-        "file_type": ext,
-        "document_type": document_type,
-        "department": department,
-    }
-    count = await qdrant_client.upsert_chunks(
-        document_id, chunks, all_embeddings, metadata
-    )
-    logger.info("[%s] Stored %d chunks in Qdrant", document_id, count)
 
-    return {
-        "document_id": document_id,
-        "status": "completed",
-        "chunk_count": count,
-        "minio_object_key": object_key,
-    }
+async def _upload(object_key: str, file: BinaryIO, content_type: str) -> str:
+    """Upload the original file to MinIO, timing it as the upload stage."""
+    with STAGE_DURATION.labels("upload").time():
+        return await minio_client.upload_file(object_key, file, content_type)
+
+
+async def _embed_in_batches(texts: list[str]) -> list[dict[str, Any]]:
+    """Embed texts in batches, running up to EMBEDDING_CONCURRENCY batches at once."""
+    semaphore = asyncio.Semaphore(EMBEDDING_CONCURRENCY)
+
+    async def run(batch: list[str]) -> list[dict[str, Any]]:
+        async with semaphore:
+            return await embedding.generate_embeddings(batch)
+
+    results = await asyncio.gather(*[
+        run(texts[i : i + EMBEDDING_BATCH_SIZE])
+        for i in range(0, len(texts), EMBEDDING_BATCH_SIZE)
+    ])
+    return [emb for batch_embeddings in results for emb in batch_embeddings]
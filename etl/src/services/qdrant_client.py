@@ -1,9 +1,11 @@
 """Qdrant vector database client."""
+import asyncio
 import logging
 from typing import Any
-from uuid import uuid4
+from uuid import UUID, uuid5
 
 import httpx
+from qdrant_client import AsyncQdrantClient, models
 
 from src.config import settings
 
@@ -11,48 +13,122 @@ logger = logging.getLogger(__name__)
 
 COLLECTION_NAME = "document_chunks"
 
+# Namespace for deterministic chunk point IDs (uuid5)
+CHUNK_ID_NAMESPACE = UUID("52d99770-7a17-4689-a723-f6185db23e69")
+
+# Payload fields indexed for filtering
+PAYLOAD_INDEXES: list[tuple[str, dict[str, str]]] = [
+    ("document_type", {"type": "keyword"}),
+    ("department", {"type": "keyword"}),
+    ("file_type", {"type": "keyword"}),
+    ("is_latest", {"type": "bool"}),
+]
+
+# Rescore quantized candidates against the original vectors to keep recall
+SEARCH_PARAMS = models.SearchParams(
+    quantization=models.QuantizationSearchParams(rescore=True, oversampling=2.0),
+)
+
+_client: httpx.AsyncClient | None = None
+_grpc_client: AsyncQdrantClient | None = None
+
+
+def get_client() -> httpx.AsyncClient:
+    """Return the shared Qdrant HTTP client, creating it on first use.
+
+    Used for collection management; point reads and writes go through
+    get_grpc_client().
+    """
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(
+            timeout=30.0,
+            limits=httpx.Limits(max_keepalive_connections=16, max_connections=32),
+        )
+    return _client
+
+
+def get_grpc_client() -> AsyncQdrantClient:
+    """Return the shared Qdrant gRPC client, creating it on first use.
+
+    gRPC sends vectors as packed float32 instead of JSON-encoded numbers.
+    """
+    global _grpc_client
+    if _grpc_client is None:
+        _grpc_client = AsyncQdrantClient(url=settings.qdrant_url, prefer_grpc=True, timeout=30)
+    return _grpc_client
+
+
+async def close_client() -> None:
+    """Close the shared Qdrant clients and their connections."""
+    global _client, _grpc_client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+    if _grpc_client is not None:
+        await _grpc_client.close()
+        _grpc_client = None
+
 
 async def ensure_collection() -> None:
     """Create the document_chunks collection if it doesn't exist."""
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        # Check if collection exists
-        resp = await client.get(
-            f"{settings.qdrant_url}/collections/{COLLECTION_NAME}"
-        )
-        if resp.status_code == 200:
-            logger.info("Collection '%s' already exists", COLLECTION_NAME)
-            return
-
-        # Create collection with dense vector
-        create_body = {
-            "vectors": {
-                "dense": {
-                    "size": 1024,
-                    "distance": "Cosine",
-                }
-            },
-        }
+    client = get_client()
+    # Check if collection exists
+    resp = await client.get(
+        f"{settings.qdrant_url}/collections/{COLLECTION_NAME}"
+    )
+    if resp.status_code == 200:
+        logger.info("Collection '%s' already exists", COLLECTION_NAME)
+        return
+
+    # Create collection with dense vector. Full-precision vectors live on disk;
+    # int8-quantized copies stay in RAM for search and are rescored on read.
+    create_body = {
+        "vectors": {
+            "dense": {
+                "size": 1024,
+                "distance": "Cosine",
+                "on_disk": True,
+            }
+        },
+        "quantization_config": {
+            "scalar": {
+                "type": "int8",
+                "quantile": 0.99,
+                "always_ram": True,
+            }
+        },
+    }
 
-        resp = await client.put(
-            f"{settings.qdrant_url}/collections/{COLLECTION_NAME}",
-            json=create_body,
+    resp = await client.put(
+        f"{settings.qdrant_url}/collections/{COLLECTION_NAME}",
+        json=create_body,
+    )
+    resp.raise_for_status()
+    logger.info("Created collection '%s'", COLLECTION_NAME)
+
+    # Create payload indexes for filtering
+    await asyncio.gather(*[
+        client.put(
+            f"{settings.qdrant_url}/collections/{COLLECTION_NAME}/index",
+            json={"field_name": field, "field_schema": schema},
         )
-        resp.raise_for_status()
-        logger.info("Created collection '%s'", COLLECTION_NAME)
+        for field, schema in PAYLOAD_INDEXES
+    ])
+
+    logger.info("Created payload indexes")
 
-        # Create payload indexes for filtering
-        for field, schema in [
-            ("document_type", {"type": "keyword"}),
-            ("department", {"type": "keyword"}),
-            ("file_type", {"type": "keyword"}),
-            ("is_latest", {"type": "bool"}),
-        ]:
-            await client.put(
-                f"{settings.qdrant_url}/collections/{COLLECTION_NAME}/index",
-                json={"field_name": field, "field_schema": schema},
-            )
 
-        logger.info("Created payload indexes")
+def chunk_point_id(document_id: str, chunk: dict[str, Any]) -> str:
+    """Deterministic point ID for a chunk.
+
+    Keyed on document_id, so retrying an upsert for the same document
+    overwrites its points. Chunks of other documents never collide, even
+    when file names and texts match.
+    """
+    return uuid5(
+        CHUNK_ID_NAMESPACE, f"{document_id}:{chunk['chunk_index']}:{chunk['text']}"
+    ).hex
 
 
 async def upsert_chunks(
@@ -65,37 +141,39 @@ async def upsert_chunks(
     if not chunks or not embeddings:
         return 0
 
-    points = []
-    for chunk, embedding in zip(chunks, embeddings):
-        point_id = str(uuid4())
-        dense_vector = embedding.get("dense", [])
-
-        payload = {
-            "document_id": document_id,
-            "chunk_index": chunk["chunk_index"],
-            "text": chunk["text"],
-            "heading": chunk.get("heading", ""),
-            "char_count": chunk.get("char_count", 0),
-            "file_name": metadata.get("file_name", ""),
-            "file_type": metadata.get("file_type", ""),
-            "document_type": metadata.get("document_type", ""),
-            "department": metadata.get("department", ""),
-            "is_latest": True,
-        }
-
-        points.append({
-            "id": point_id,
-            "vector": {"dense": dense_vector},
-            "payload": payload,
-        })
+    # Document-level payload fields are the same for every chunk
+    file_name = metadata.get("file_name", "")
+    file_type = metadata.get("file_type", "")
+    document_type = metadata.get("document_type", "")
+    department = metadata.get("department", "")
+
+    points = [
+        models.PointStruct(
+            id=chunk_point_id(document_id, chunk),
+            vector={"dense": embedding.get("dense", [])},
+            payload={
+                "document_id": document_id,
+                "chunk_index": chunk["chunk_index"],
+                "text": chunk["text"],
+                "heading": chunk.get("heading", ""),
+                "char_count": chunk.get("char_count", 0),
+                "file_name": file_name,
+                "file_type": file_type,
+                "document_type": document_type,
+                "department": department,
+                "is_latest": True,
+            },
+        )
+        for chunk, embedding in zip(chunks, embeddings)
+    ]
 
     # Batch upsert
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        resp = await client.put(
-            f"{settings.qdrant_url}/collections/{COLLECTION_NAME}/points",
-            json={"points": points},
-        )
-        resp.raise_for_status()
+    await get_grpc_client().upsert(
+        collection_name=COLLECTION_NAME,
+        points=points,
+        wait=False,
+        timeout=60,
+    )
 
     logger.info("Upserted %d chunks for document %s", len(points), document_id)
     return len(points)
@@ -107,46 +185,44 @@ async def search_chunks(
     filters: dict[str, Any] | None = None,
 ) -> list[dict[str, Any]]:
     """Search for similar chunks."""
-    search_body: dict[str, Any] = {
-        "vector": {"name": "dense", "vector": query_vector},
-        "limit": limit,
-        "with_payload": True,
-    }
+    query_filter: models.Filter | None = None
 
     if filters:
-        must_conditions = []
+        must_conditions: list[models.Condition] = []
         if "is_latest" in filters:
-            must_conditions.append({
-                "key": "is_latest",
-                "match": {"value": filters["is_latest"]},
-            })
+            must_conditions.append(models.FieldCondition(
+                key="is_latest",
+                match=models.MatchValue(value=filters["is_latest"]),
+            ))
         if "document_type" in filters:
-            must_conditions.append({
-                "key": "document_type",
-                "match": {"any": filters["document_type"]},
-            })
+            must_conditions.append(models.FieldCondition(
+                key="document_type",
+                match=models.MatchAny(any=filters["document_type"]),
+            ))
         if "department" in filters:
-            must_conditions.append({
-                "key": "department",
-                "match": {"value": filters["department"]},
-            })
+            must_conditions.append(models.FieldCondition(
+                key="department",
+                match=models.MatchValue(value=filters["department"]),
+            ))
         if must_conditions:
-            search_body["filter"] = {"must": must_conditions}
-
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        resp = await client.post(
-            f"{settings.qdrant_url}/collections/{COLLECTION_NAME}/points/search",
-            json=search_body,
-        )
-        resp.raise_for_status()
-        data = resp.json()
+            query_filter = models.Filter(must=must_conditions)
+
+    response = await get_grpc_client().query_points(
+        collection_name=COLLECTION_NAME,
+        query=query_vector,
+        using="dense",
+        query_filter=query_filter,
+        search_params=SEARCH_PARAMS,
+        limit=limit,
+        with_payload=True,
+    )
 
     results = []
-    for point in data.get("result", []):
-        payload = point.get("payload", {})
+    for point in response.points:
+        payload = point.payload or {}
         results.append({
-            "chunk_id": point.get("id"),
-            "score": point.get("score", 0),
+            "chunk_id": str(point.id),
+            "score": point.score,
             "text": payload.get("text", ""),
             "document_id": payload.get("document_id", ""),
             "file_name": payload.get("file_name", ""),
@@ -159,16 +235,15 @@ async def search_chunks(
 
 async def delete_document_chunks(document_id: str) -> None:
     """Delete all chunks for a document."""
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        resp = await client.post(
-            f"{settings.qdrant_url}/collections/{COLLECTION_NAME}/points/delete",
-            json={
-                "filter": {
-                    "must": [
-                        {"key": "document_id", "match": {"value": document_id}}
-                    ]
-                }
-            },
-        )
-        resp.raise_for_status()
+    await get_grpc_client().delete(
+        collection_name=COLLECTION_NAME,
+        points_selector=models.FilterSelector(
+            filter=models.Filter(must=[
+                models.FieldCondition(
+                    key="document_id", match=models.MatchValue(value=document_id)
+                )
+            ])
+        ),
+        wait=False,
+    )
     logger.info("Deleted chunks for document %s", document_id)
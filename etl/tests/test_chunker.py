@@ -0,0 +1,68 @@
+from src.services.chunker import chunk_text, chunk_text_stream
+
+
+def test_empty_text_returns_no_chunks() -> None:
+    assert chunk_text("") == []
+    assert chunk_text(" \n\n ") == []
+
+
+def test_short_text_is_a_single_chunk() -> None:
+    assert chunk_text("  議事録です。\n出席者: 3名  ") == [
+        {"text": "議事録です。\n出席者: 3名", "chunk_index": 0, "heading": "", "char_count": 14}
+    ]
+
+
+def test_short_text_with_heading_keeps_heading() -> None:
+    chunks = chunk_text("# 議事録\n出席者: 3名")
+
+    assert [(c["heading"], c["text"]) for c in chunks] == [("議事録", "議事録\n出席者: 3名")]
+
+
+def test_headings_start_new_sections() -> None:
+    text = "前文です。\n# 概要\n本文A\n\n本文B\n## 手順\n手順1"
+
+    chunks = chunk_text(text, chunk_size=10, chunk_overlap=0)
+
+    assert [(c["heading"], c["text"]) for c in chunks] == [
+        ("", "前文です。"),
+        ("概要", "概要\n本文A\n本文B"),
+        ("手順", "手順\n手順1"),
+    ]
+    assert [c["chunk_index"] for c in chunks] == [0, 1, 2]
+
+
+def test_only_up_to_four_hashes_mark_a_heading() -> None:
+    chunks = chunk_text("##### not a heading\nbody", chunk_size=10)
+
+    assert all(c["heading"] == "" for c in chunks)
+
+
+def test_overlap_carries_tail_of_previous_chunk() -> None:
+    text = "a" * 8 + "\n\n" + "b" * 8
+
+    chunks = chunk_text(text, chunk_size=10, chunk_overlap=3)
+
+    assert [c["text"] for c in chunks] == ["a" * 8, "aaa\n" + "b" * 8]
+
+
+def test_long_paragraph_is_split_into_sentences() -> None:
+    sentence = "これは長い文です。" * 10
+    text = sentence * 7
+
+    chunks = chunk_text(text, chunk_size=100, chunk_overlap=0)
+
+    assert len(chunks) > 1
+    assert all(c["text"].endswith("。") for c in chunks)
+    assert all(c["char_count"] == len(c["text"]) for c in chunks)
+
+
+def test_stream_carries_section_across_pages() -> None:
+    pages = ["# 概要\n本文A", "本文B", "## 手順\n手順1"]
+
+    chunks = list(chunk_text_stream(pages, chunk_size=100))
+
+    assert chunks == chunk_text("\n\n".join(pages), chunk_size=100)
+    assert [(c["heading"], c["text"]) for c in chunks] == [
+        ("概要", "概要\n本文A\n本文B"),
+        ("手順", "手順\n手順1"),
+    ]
@@ -0,0 +1,53 @@
+from typing import Any
+
+import pytest
+
+from src.services import embedding
+
+
+class FakeCache:
+    def __init__(self, entries: dict[str, dict[str, Any]]) -> None:
+        self.entries = dict(entries)
+
+    async def mget(self, texts: list[str]) -> list[dict[str, Any] | None]:
+        return [self.entries.get(t) for t in texts]
+
+    async def mset(self, texts: list[str], embeddings: list[dict[str, Any]]) -> None:
+        self.entries.update(zip(texts, embeddings))
+
+
+@pytest.fixture
+def requested(monkeypatch: pytest.MonkeyPatch) -> list[list[str]]:
+    calls: list[list[str]] = []
+
+    async def fake_request(texts: list[str]) -> list[dict[str, Any]]:
+        calls.append(texts)
+        return [{"dense": [float(len(t))]} for t in texts]
+
+    monkeypatch.setattr(embedding, "_request_embeddings", fake_request)
+    return calls
+
+
+async def test_only_cache_misses_are_requested(
+    monkeypatch: pytest.MonkeyPatch, requested: list[list[str]]
+) -> None:
+    cache = FakeCache({"b": {"dense": [9.0]}})
+    monkeypatch.setattr(embedding, "get_cache", lambda: cache)
+
+    result = await embedding.generate_embeddings(["a", "b", "ccc"])
+
+    assert requested == [["a", "ccc"]]
+    assert result == [{"dense": [1.0]}, {"dense": [9.0]}, {"dense": [3.0]}]
+    assert set(cache.entries) == {"a", "b", "ccc"}
+
+
+async def test_full_cache_hit_skips_llm_service(
+    monkeypatch: pytest.MonkeyPatch, requested: list[list[str]]
+) -> None:
+    cache = FakeCache({"a": {"dense": [1.0]}})
+    monkeypatch.setattr(embedding, "get_cache", lambda: cache)
+
+    result = await embedding.generate_embeddings(["a"])
+
+    assert requested == []
+    assert result == [{"dense": [1.0]}]
@@ -0,0 +1,69 @@
+import io
+from typing import Any
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.main import app
+from src.services import pipeline
+from src.services.parser import ParsedDocument
+
+
+@pytest.fixture
+def calls(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """Replace parse, embedding, MinIO and Qdrant with fakes that log their calls."""
+    log: list[str] = []
+
+    async def parse(file_bytes: bytes, file_name: str) -> ParsedDocument:
+        log.append("parse")
+        return ParsedDocument(metadata={}, pages=["# 概要\n本文です。"])
+
+    async def generate_embeddings(texts: list[str]) -> list[dict[str, Any]]:
+        log.append("embed")
+        return [{"dense": [0.1]} for _ in texts]
+
+    async def upload_file(object_key: str, file_obj: Any, content_type: str) -> str:
+        log.append("upload")
+        return object_key
+
+    async def upsert_chunks(document_id: str, chunks: list[Any], *args: Any) -> int:
+        log.append("upsert")
+        return len(chunks)
+
+    monkeypatch.setattr(pipeline, "parse_document_async", parse)
+    monkeypatch.setattr(pipeline.embedding, "generate_embeddings", generate_embeddings)
+    monkeypatch.setattr(pipeline.minio_client, "upload_file", upload_file)
+    monkeypatch.setattr(pipeline.qdrant_client, "upsert_chunks", upsert_chunks)
+    return log
+
+
+async def test_chunks_are_stored_after_upload(calls: list[str]) -> None:
+    result = await pipeline.process_document(io.BytesIO(b"%PDF"), "manual.pdf")
+
+    assert result["status"] == "completed"
+    assert result["chunk_count"] == 1
+    assert calls.index("upload") < calls.index("upsert")
+
+
+async def test_failed_upload_stores_no_chunks(
+    monkeypatch: pytest.MonkeyPatch, calls: list[str]
+) -> None:
+    async def failing_upload(object_key: str, file_obj: Any, content_type: str) -> str:
+        raise RuntimeError("minio down")
+
+    monkeypatch.setattr(pipeline.minio_client, "upload_file", failing_upload)
+
+    with pytest.raises(RuntimeError, match="minio down"):
+        await pipeline.process_document(io.BytesIO(b"%PDF"), "manual.pdf")
+
+    assert "upsert" not in calls
+
+
+async def test_stage_durations_are_exported(calls: list[str]) -> None:
+    await pipeline.process_document(io.BytesIO(b"%PDF"), "manual.pdf")
+
+    response = TestClient(app).get("/metrics")
+
+    assert response.status_code == 200
+    for stage in ("parse", "chunk", "embed", "upsert", "upload"):
+        assert f'etl_processing_duration_seconds_count{{stage="{stage}"}}' in response.text
@@ -0,0 +1,40 @@
+from typing import Any
+
+import pytest
+
+from src.services import qdrant_client
+
+
+class FakeGrpcClient:
+    def __init__(self) -> None:
+        self.points: list[Any] = []
+
+    async def upsert(self, points: list[Any], **kwargs: Any) -> None:
+        self.points.extend(points)
+
+
+async def test_same_named_files_from_different_departments_do_not_collide(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    fake = FakeGrpcClient()
+    monkeypatch.setattr(qdrant_client, "get_grpc_client", lambda: fake)
+    chunks = [{"chunk_index": 0, "text": "表紙", "heading": "", "char_count": 2}]
+    embeddings = [{"dense": [0.1]}]
+
+    for document_id, department in [("doc-a", "製造部"), ("doc-b", "品質保証部")]:
+        await qdrant_client.upsert_chunks(
+            document_id, chunks, embeddings,
+            {"file_name": "手順書.pdf", "department": department},
+        )
+
+    point_a, point_b = fake.points
+    assert point_a.id != point_b.id
+    assert [p.payload["department"] for p in fake.points] == ["製造部", "品質保証部"]
+
+
+def test_chunk_point_id_is_stable_for_a_document() -> None:
+    chunk = {"chunk_index": 0, "text": "本文です。"}
+
+    assert qdrant_client.chunk_point_id("doc-a", chunk) == qdrant_client.chunk_point_id(
+        "doc-a", dict(chunk)
+    )
@@ -3,23 +3,26 @@ import httpx
 import json
 from typing import Any
 
-from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel
+import msgspec
+from fastapi import APIRouter, HTTPException, Request
 from sse_starlette.sse import EventSourceResponse
 
 from src.config import settings
+from src.serialization import decode_body, openapi_body
 
 router = APIRouter()
 
 
-class ChatRequest(BaseModel):
+class ChatRequest(msgspec.Struct):
     query: str
     chat_session_id: str | None = None
     context: list[str] = []
 
 
-@router.post("/chat/stream")
-async def chat_stream(request: ChatRequest) -> EventSourceResponse:
+@router.post("/chat/stream", openapi_extra=openapi_body(ChatRequest))
+async def chat_stream(raw_request: Request) -> EventSourceResponse:
+    request = await decode_body(raw_request, ChatRequest)
+
     async def generate() -> Any:
         yield {"event": "start", "data": json.dumps({"status": "generating"})}
 
@@ -1,23 +1,30 @@
+import base64
+import struct
+
 import httpx
-from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel
+import msgspec
+from fastapi import APIRouter, HTTPException, Request, Response
 
 from src.config import settings
+from src.serialization import decode_body, json_response, openapi_body
 
 router = APIRouter()
 
 
-class EmbeddingRequest(BaseModel):
+class EmbeddingRequest(msgspec.Struct):
     texts: list[str]
     return_sparse: bool = False
+    # Return each dense vector as base64 little-endian float16 ("dense_fp16_b64")
+    binary: bool = False
 
 
-class EmbeddingResponse(BaseModel):
-    embeddings: list[dict[str, list[float] | dict[str, list[int | float]]]]
+class EmbeddingResponse(msgspec.Struct):
+    embeddings: list[dict[str, list[float] | str | dict[str, list[int | float]]]]
 
 
-@router.post("/embeddings")
-async def generate_embeddings(request: EmbeddingRequest) -> EmbeddingResponse:
+@router.post("/embeddings", openapi_extra=openapi_body(EmbeddingRequest))
+async def generate_embeddings(raw_request: Request) -> Response:
+    request = await decode_body(raw_request, EmbeddingRequest)
     try:
         async with httpx.AsyncClient(timeout=60.0) as client:
             resp = await client.post(
@@ -31,9 +38,17 @@ async def generate_embeddings(request: EmbeddingRequest) -> EmbeddingResponse:
             data = resp.json()
             embeddings_list = data.get("embeddings", [])
 
-            result = [{"dense": emb} for emb in embeddings_list]
-            return EmbeddingResponse(embeddings=result)
+            result: list[dict[str, list[float] | str | dict[str, list[int | float]]]]
+            if request.binary:
+                result = [{"dense_fp16_b64": _encode_fp16(emb)} for emb in embeddings_list]
+            else:
+                result = [{"dense": emb} for emb in embeddings_list]
+            return json_response(EmbeddingResponse(embeddings=result))
     except httpx.HTTPStatusError as e:
         raise HTTPException(status_code=502, detail=f"Ollama error: {e.response.text}")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Embedding generation failed: {e}")
+
+
+def _encode_fp16(vector: list[float]) -> str:
+    return base64.b64encode(struct.pack(f"<{len(vector)}e", *vector)).decode("ascii")
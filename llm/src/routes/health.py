@@ -1,6 +1,7 @@
+from typing import Any
+
 import httpx
 from fastapi import APIRouter
-from fastapi.responses import JSONResponse
 
 from src.config import settings
 
@@ -8,7 +9,7 @@ router = APIRouter()
 
 
 @router.get("/health")
-async def health_check() -> JSONResponse:
+async def health_check() -> dict[str, Any]:
     ollama_ok = False
     try:
         async with httpx.AsyncClient(timeout=5.0) as client:
@@ -17,12 +18,10 @@ async def health_check() -> JSONResponse:
     except Exception:
         pass
 
-    return JSONResponse(
-        content={
-            "status": "healthy" if ollama_ok else "degraded",
-            "service": "llm-service",
-            "version": "0.1.0",
-            "ollama": "connected" if ollama_ok else "disconnected",
-            "model": settings.llm_model,
-        }
-    )
+    return {
+        "status": "healthy" if ollama_ok else "degraded",
+        "service": "llm-service",
+        "version": "0.1.0",
+        "ollama": "connected" if ollama_ok else "disconnected",
+        "model": settings.llm_model,
+    }
@@ -0,0 +1,44 @@
+"""msgspec-based JSON decoding and encoding for hot-path routes."""
+from typing import Any, TypeVar
+
+import msgspec
+from fastapi import HTTPException, Request, Response
+
+T = TypeVar("T")
+
+
+async def decode_body(request: Request, type_: type[T]) -> T:
+    """Decode and validate the JSON request body, bypassing Pydantic."""
+    body = await request.body()
+    try:
+        return msgspec.json.decode(body, type=type_)
+    except msgspec.DecodeError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
+
+def openapi_body(type_: type[Any]) -> dict[str, Any]:
+    """openapi_extra documenting type_ as the JSON request body.
+
+    Routes that call decode_body take a raw Request, so FastAPI can't infer
+    the body schema itself.
+    """
+    schema = msgspec.json.schema(type_)
+    defs = schema.pop("$defs", {})
+    # Inline the top-level $ref; request Structs don't nest other Structs
+    if "$ref" in schema:
+        schema = defs[schema["$ref"].rsplit("/", 1)[-1]]
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": schema}},
+        }
+    }
+
+
+def json_response(content: object, status_code: int = 200) -> Response:
+    """Encode content with msgspec into a JSON response."""
+    return Response(
+        content=msgspec.json.encode(content),
+        status_code=status_code,
+        media_type="application/json",
+    )
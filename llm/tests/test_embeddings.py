@@ -0,0 +1,55 @@
+import base64
+import struct
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from src.main import app
+
+client = TestClient(app)
+
+
+@pytest.fixture
+def fake_ollama(monkeypatch: pytest.MonkeyPatch) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"embeddings": [[0.5, -0.25], [1.0, 0.0]]})
+
+    real_client = httpx.AsyncClient
+
+    def client_factory(**kwargs: object) -> httpx.AsyncClient:
+        return real_client(transport=httpx.MockTransport(handler))
+
+    monkeypatch.setattr(httpx, "AsyncClient", client_factory)
+
+
+def test_embeddings_returns_dense_vectors(fake_ollama: None) -> None:
+    response = client.post("/internal/embeddings", json={"texts": ["a", "b"]})
+
+    assert response.status_code == 200
+    assert response.json() == {"embeddings": [{"dense": [0.5, -0.25]}, {"dense": [1.0, 0.0]}]}
+
+
+def test_embeddings_binary_returns_fp16_base64(fake_ollama: None) -> None:
+    response = client.post("/internal/embeddings", json={"texts": ["a", "b"], "binary": True})
+
+    assert response.status_code == 200
+    encoded = [e["dense_fp16_b64"] for e in response.json()["embeddings"]]
+    assert [list(struct.unpack("<2e", base64.b64decode(e))) for e in encoded] == [
+        [0.5, -0.25],
+        [1.0, 0.0],
+    ]
+
+
+def test_embeddings_rejects_invalid_body() -> None:
+    response = client.post("/internal/embeddings", json={"texts": "not a list"})
+
+    assert response.status_code == 422
+
+
+def test_embeddings_request_body_is_documented() -> None:
+    operation = app.openapi()["paths"]["/internal/embeddings"]["post"]
+
+    schema = operation["requestBody"]["content"]["application/json"]["schema"]
+    assert schema["required"] == ["texts"]
+    assert set(schema["properties"]) == {"texts", "return_sparse", "binary"}